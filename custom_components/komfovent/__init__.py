@@ -72,7 +72,7 @@ async def _async_update_listener(
     """Handle options update."""
     coordinator = entry.runtime_data.coordinator
     update_interval = entry.options.get(OPT_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-    coordinator.update_interval = timedelta(seconds=update_interval)
+    coordinator.set_base_update_interval(timedelta(seconds=update_interval))
     coordinator.ema_time_constant = entry.options.get(
         OPT_EMA_TIME_CONSTANT, DEFAULT_EMA_TIME_CONSTANT
     )
@@ -18,7 +18,6 @@ if TYPE_CHECKING:
     from .coordinator import KomfoventConfigEntry, KomfoventCoordinator
 
 from . import registers
-from .helpers import build_device_info
 
 # Status bitmask values
 BITMASK_STARTING: Final = 1 << 0  # 1
@@ -211,7 +210,7 @@ class KomfoventBinarySensor(
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
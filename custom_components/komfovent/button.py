@@ -15,7 +15,6 @@ if TYPE_CHECKING:
     from .coordinator import KomfoventConfigEntry, KomfoventCoordinator
 
 from . import services
-from .helpers import build_device_info
 
 
 async def async_setup_entry(
@@ -74,7 +73,7 @@ class KomfoventButtonEntity(CoordinatorEntity["KomfoventCoordinator"], ButtonEnt
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
 
 class KomfoventSetTimeButton(KomfoventButtonEntity):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar, Final
 
 from homeassistant.components.climate import (
@@ -24,9 +25,10 @@ from .const import (
     OperationMode,
     TemperatureControl,
 )
-from .helpers import build_device_info
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -68,7 +70,7 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
         """Initialize the climate device."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_climate"
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
         self._eco_mode = False
         self._auto_mode = False
 
@@ -98,13 +100,12 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
             return None
 
         try:
-            mode = OperationMode(
-                self.coordinator.data.get(registers.REG_OPERATION_MODE)
-            )
-            temp_reg = MODE_TEMP_MAPPING[mode]
+            temp_reg = MODE_TEMP_MAPPING_BY_CODE[
+                self.coordinator.data[registers.REG_OPERATION_MODE]
+            ]
             if (temp := self.coordinator.data.get(temp_reg)) is not None:
                 return float(temp) / 10
-        except (ValueError, KeyError):
+        except (IndexError, KeyError):
             _LOGGER.warning("Invalid operation mode or temperature value")
 
         return None
@@ -169,11 +170,10 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
 
         # Get current mode and its temperature register
         try:
-            mode = OperationMode(
-                self.coordinator.data.get(registers.REG_OPERATION_MODE)
-            )
-            reg = MODE_TEMP_MAPPING[mode]
-        except (ValueError, KeyError):
+            reg = MODE_TEMP_MAPPING_BY_CODE[
+                self.coordinator.data[registers.REG_OPERATION_MODE]
+            ]
+        except (IndexError, KeyError):
             _LOGGER.warning("Invalid operation mode, using normal setpoint")
             reg = registers.REG_NORMAL_SETPOINT
 
@@ -209,24 +209,26 @@ class KomfoventClimate(CoordinatorEntity["KomfoventCoordinator"], ClimateEntity)
         await services.set_operation_mode(self.coordinator, preset_mode)
 
 
-MODE_TEMP_MAPPING = {
-    OperationMode.STANDBY: registers.REG_NORMAL_SETPOINT,  # Use normal temp for standby
-    OperationMode.AWAY: registers.REG_AWAY_TEMP,
-    OperationMode.NORMAL: registers.REG_NORMAL_SETPOINT,
-    OperationMode.INTENSIVE: registers.REG_INTENSIVE_TEMP,
-    OperationMode.BOOST: registers.REG_BOOST_TEMP,
-    OperationMode.KITCHEN: registers.REG_KITCHEN_TEMP,
-    OperationMode.FIREPLACE: registers.REG_FIREPLACE_TEMP,
-    OperationMode.OVERRIDE: registers.REG_OVERRIDE_TEMP,
-    OperationMode.HOLIDAY: registers.REG_HOLIDAYS_TEMP,
-    OperationMode.AIR_QUALITY: registers.REG_AQ_TEMP_SETPOINT,
-    OperationMode.OFF: registers.REG_NORMAL_SETPOINT,  # Use normal temp when off
-}
-TEMP_CONTROL_MAPPING = {
-    TemperatureControl.SUPPLY: registers.REG_SUPPLY_TEMP,
-    TemperatureControl.EXTRACT: registers.REG_EXTRACT_TEMP,
-    # Using panel1 temp for room temperature
-    TemperatureControl.ROOM: registers.REG_PANEL1_TEMP,
-    # Using extract temp for balance mode
-    TemperatureControl.BALANCE: registers.REG_EXTRACT_TEMP,
-}
+# Setpoint register per raw REG_OPERATION_MODE value. Modes without a setpoint
+# of their own (standby, off) use the normal setpoint.
+_mode_temp_registers = [registers.REG_NORMAL_SETPOINT] * len(OperationMode)
+_mode_temp_registers[OperationMode.AWAY] = registers.REG_AWAY_TEMP
+_mode_temp_registers[OperationMode.INTENSIVE] = registers.REG_INTENSIVE_TEMP
+_mode_temp_registers[OperationMode.BOOST] = registers.REG_BOOST_TEMP
+_mode_temp_registers[OperationMode.KITCHEN] = registers.REG_KITCHEN_TEMP
+_mode_temp_registers[OperationMode.FIREPLACE] = registers.REG_FIREPLACE_TEMP
+_mode_temp_registers[OperationMode.OVERRIDE] = registers.REG_OVERRIDE_TEMP
+_mode_temp_registers[OperationMode.HOLIDAY] = registers.REG_HOLIDAYS_TEMP
+_mode_temp_registers[OperationMode.AIR_QUALITY] = registers.REG_AQ_TEMP_SETPOINT
+MODE_TEMP_MAPPING_BY_CODE: Final[tuple[int, ...]] = tuple(_mode_temp_registers)
+del _mode_temp_registers
+TEMP_CONTROL_MAPPING: Final[Mapping[TemperatureControl, int]] = MappingProxyType(
+    {
+        TemperatureControl.SUPPLY: registers.REG_SUPPLY_TEMP,
+        TemperatureControl.EXTRACT: registers.REG_EXTRACT_TEMP,
+        # Using panel1 temp for room temperature
+        TemperatureControl.ROOM: registers.REG_PANEL1_TEMP,
+        # Using extract temp for balance mode
+        TemperatureControl.BALANCE: registers.REG_EXTRACT_TEMP,
+    }
+)
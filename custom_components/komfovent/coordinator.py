@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import CONF_HOST, CONF_PORT
@@ -22,16 +24,23 @@ from .const import (
     DEFAULT_EMA_TIME_CONSTANT,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
-    ConnectedPanels,
+    MAX_FAILURE_BACKOFF_EXPONENT,
+    MAX_UPDATE_INTERVAL,
+    PANEL1_CONNECTED,
+    PANEL2_CONNECTED,
+    SETTINGS_MAX_AGE,
+    UPDATE_DURATION_SAMPLES,
+    UPDATE_INTERVAL_RTT_FACTOR,
     Controller,
 )
-from .core.ema import apply_ema
-from .helpers import get_controller_version
+from .core.ema import apply_ema_alpha, ema_alpha
+from .helpers import build_device_info, get_controller_version
 from .modbus import KomfoventModbusClient
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +49,100 @@ FUNC_VER_AQ_HUMIDITY = 38
 FUNC_VER_EXHAUST_TEMP = 67
 
 
+@dataclass(frozen=True)
+class ReadBlock:
+    """A contiguous range of holding registers read during each poll."""
+
+    start: int
+    count: int
+    description: str
+    # Failing a required block fails the whole update, optional blocks are skipped
+    required: bool = True
+    log_level: int = logging.WARNING
+    # Seconds the previous values may be reused for, 0 reads on every poll
+    max_age: float = 0
+
+    @property
+    def end(self) -> int:
+        """Return the register number following the last one in the block."""
+        return self.start + self.count
+
+
+# Panel firmware versions with the connected panels values including the panel
+PANEL_FIRMWARE_BLOCKS = (
+    (
+        PANEL1_CONNECTED,
+        ReadBlock(
+            registers.REG_PANEL1_FW, 2, "panel 1 firmware version", required=False
+        ),
+    ),
+    (
+        PANEL2_CONNECTED,
+        ReadBlock(
+            registers.REG_PANEL2_FW, 2, "panel 2 firmware version", required=False
+        ),
+    ),
+)
+
+
+def build_read_plan(controller: Controller, func_version: int) -> tuple[ReadBlock, ...]:
+    """
+    Build the per-poll read plan for a controller firmware.
+
+    Args:
+        controller: Controller type
+        func_version: Functional version of the controller firmware
+
+    Returns:
+        Register blocks to read on every poll, each with its own request
+
+    """
+    legacy_c6 = (
+        controller in {Controller.C6, Controller.C6M}
+        and func_version < FUNC_VER_AQ_HUMIDITY
+    )
+    blocks = [
+        # Primary control (1-34)
+        ReadBlock(registers.REG_POWER, 34, "primary control"),
+        # Connectivity, extra control (35-44)
+        # This has not been tested yet, it may be implemented in the future
+        # Mode settings (100-158)
+        ReadBlock(registers.REG_AWAY_FAN_SUPPLY, 59, "modes", max_age=SETTINGS_MAX_AGE),
+        # Humidity setpoints (159-162)
+        # This has not been tested yet, it may be implemented in the future
+        # Eco and air quality (200-214 on legacy C6, 200-217 otherwise)
+        ReadBlock(
+            registers.REG_ECO_MIN_TEMP,
+            15 if legacy_c6 else 18,
+            "eco",
+            max_age=SETTINGS_MAX_AGE,
+        ),
+        # Skip scheduler (300-555)
+        # Active alarms (600-610)
+        ReadBlock(registers.REG_ACTIVE_ALARMS_COUNT, 11, "active alarms"),
+        # Skip alarm history (611-861)
+        # Monitoring (900-955 on legacy C6, 900-957 otherwise)
+        ReadBlock(registers.REG_STATUS, 56 if legacy_c6 else 58, "monitoring"),
+        # Firmware versions (1000-1005) are cached, see refresh_static
+    ]
+    # Skip digital outputs (958-960)
+    # Exhaust temperature (961)
+    if (
+        controller in {Controller.C6, Controller.C6M}
+        and func_version >= FUNC_VER_EXHAUST_TEMP
+    ):
+        blocks.append(
+            ReadBlock(
+                registers.REG_EXHAUST_TEMP,
+                1,
+                "exhaust temperature",
+                required=False,
+                log_level=logging.DEBUG,
+            )
+        )
+    return tuple(blocks)
+
+
 class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
     """Class to manage fetching Komfovent data."""
 
@@ -48,7 +151,23 @@ class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
     func_version: int = 0
     client: KomfoventModbusClient
     ema_time_constant: int
-    _cooldown_until: datetime | None = None
+    _read_plan: tuple[ReadBlock, ...]
+    _static: dict[int, Any]
+    # time.monotonic() of the last successful read of each block in the plan
+    _read_at: dict[ReadBlock, float]
+    # Incremented when _read_at is invalidated, so a poll running at the time
+    # does not mark the values it read before the invalidation as fresh
+    _read_generation: int = 0
+    # Connected panels value the cached panel firmware versions were read for
+    _static_panels: int | None = None
+    # time.monotonic() deadline before which updates wait
+    _cooldown_until: float | None = None
+    # Update interval configured by the user, widened when polls are slow
+    base_update_interval: timedelta
+    _update_durations: deque[float]
+    _consecutive_failures: int = 0
+    # Device info shared by all entities, rebuilt when the controller changes
+    _device_info: DeviceInfo | None = None
 
     def __init__(
         self,
@@ -64,21 +183,62 @@ class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
 
         super().__init__(hass, _LOGGER, config_entry=config_entry, **kwargs)
 
+        self.base_update_interval = kwargs["update_interval"]
+        self._update_durations = deque(maxlen=UPDATE_DURATION_SAMPLES)
+
         self.client = KomfoventModbusClient(
             host=config_entry.data[CONF_HOST],
             port=config_entry.data[CONF_PORT],
         )
         self.ema_time_constant = ema_time_constant
+        self._read_plan = build_read_plan(self.controller, self.func_version)
+        self._static = {}
+        self._read_at = {}
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of this device."""
+        if self._device_info is None:
+            self._device_info = build_device_info(self)
+        return self._device_info
+
+    def set_base_update_interval(self, interval: timedelta) -> None:
+        """Set the configured update interval, dropping any widening."""
+        self.base_update_interval = interval
+        self.update_interval = interval
+
+    def _adapt_update_interval(self, duration: float) -> None:
+        """Widen the update interval when polls take a large share of it."""
+        self._consecutive_failures = 0
+        self._update_durations.append(duration)
+        average = sum(self._update_durations) / len(self._update_durations)
+        seconds = min(
+            MAX_UPDATE_INTERVAL,
+            max(
+                self.base_update_interval.total_seconds(),
+                UPDATE_INTERVAL_RTT_FACTOR * average,
+            ),
+        )
+        self.update_interval = timedelta(seconds=seconds)
+
+    def _back_off(self) -> None:
+        """Space out updates exponentially after consecutive failures."""
+        self._consecutive_failures += 1
+        factor = 2 ** min(self._consecutive_failures, MAX_FAILURE_BACKOFF_EXPONENT)
+        self.update_interval = min(
+            timedelta(seconds=MAX_UPDATE_INTERVAL),
+            self.base_update_interval * factor,
+        )
 
     def set_cooldown(self, seconds: float) -> None:
         """Set a cooldown period before the next update can proceed."""
-        self._cooldown_until = utcnow() + timedelta(seconds=seconds)
+        self._cooldown_until = time.monotonic() + seconds
 
     async def _wait_for_cooldown(self) -> None:
         """Wait for cooldown period to expire if set."""
         if self._cooldown_until is None:
             return
-        wait_time = (self._cooldown_until - utcnow()).total_seconds()
+        wait_time = self._cooldown_until - time.monotonic()
         if wait_time > 0:
             await asyncio.sleep(wait_time)
 
@@ -92,108 +252,143 @@ class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
 
         error_msg = "Failed to read controller firmware version"
         try:
-            # Get firmware version and extract functional version from it
-            fw_data = await self.client.read(registers.REG_FIRMWARE, 2)
-            fw_version = get_controller_version(fw_data.get(registers.REG_FIRMWARE, 0))
-            self.controller = fw_version[0]
-            self.func_version = fw_version[4]
+            await self.refresh_static()
         except (ConnectionError, ModbusException) as error:
             _LOGGER.warning("%s: %s", error_msg, error)
             raise ConfigEntryNotReady(error_msg) from error
 
         return True
 
+    async def refresh_static(self) -> None:
+        """
+        Re-read the firmware versions cached across polls.
+
+        Firmware versions only change when the controller is updated or replaced,
+        so they are read here instead of on every poll. Panel firmware versions
+        are re-read on the next poll.
+        """
+        # Get firmware version and extract functional version from it
+        fw_data = await self.client.read(registers.REG_FIRMWARE, 2)
+        fw_version = get_controller_version(fw_data.get(registers.REG_FIRMWARE, 0))
+        self.controller = fw_version[0]
+        self.func_version = fw_version[4]
+        self._read_plan = build_read_plan(self.controller, self.func_version)
+        self._read_at.clear()
+        self._static = fw_data
+        self._static_panels = None
+        self._device_info = None
+
+    async def _read_panel_firmware(self, connected_panels: int) -> None:
+        """Cache the firmware versions of the connected control panels."""
+        blocks = []
+        for panels, block in PANEL_FIRMWARE_BLOCKS:
+            self._static.pop(block.start, None)
+            if connected_panels in panels:
+                blocks.append(block)
+
+        # Both panels are read with a single request when both are connected,
+        # their firmware registers are adjacent
+        await self._read_group(tuple(blocks), self._static)
+
+        # Retry on the next poll if any of the reads failed
+        if all(block.start in self._static for block in blocks):
+            self._static_panels = connected_panels
+        else:
+            self._static_panels = None
+
+    async def _read_block(self, block: ReadBlock, data: dict[int, Any]) -> None:
+        """Read a single block into data, skipping optional blocks on failure."""
+        try:
+            await self.client.read_into(block.start, block.count, data)
+        except (ConnectionError, ModbusException) as error:
+            if block.required:
+                raise
+            _LOGGER.log(
+                block.log_level, "Failed to read %s: %s", block.description, error
+            )
+
+    async def _read_group(
+        self, group: tuple[ReadBlock, ...], data: dict[int, Any]
+    ) -> None:
+        """Read adjacent blocks in one request, falling back to each block."""
+        if len(group) > 1:
+            start, end = group[0].start, group[-1].end
+            try:
+                await self.client.read_into(start, end - start, data)
+            except (ConnectionError, ModbusException) as error:
+                _LOGGER.debug(
+                    "Failed to read registers %d-%d at once, "
+                    "reading blocks separately: %s",
+                    start,
+                    end - 1,
+                    error,
+                )
+            else:
+                return
+
+        for block in group:
+            await self._read_block(block, data)
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that also re-reads blocks that are still fresh."""
+        # Refreshes are requested after writes, which may change cached settings
+        self._read_generation += 1
+        self._read_at.clear()
+        await super().async_request_refresh()
+
+    def _reuse_fresh_block(
+        self, block: ReadBlock, data: dict[int, Any], now: float
+    ) -> bool:
+        """Copy a block's previous values into data if they are recent enough."""
+        read_at = self._read_at.get(block)
+        if read_at is None or self.data is None or now - read_at >= block.max_age:
+            return False
+
+        previous = self.data
+        for reg in range(block.start, block.end):
+            if reg in previous:
+                data[reg] = previous[reg]
+        return True
+
     async def _async_update_data(self) -> dict[int, Any]:
         """Fetch data from Komfovent."""
         await self._wait_for_cooldown()
 
         data = {}
+        started = time.monotonic()
+        generation = self._read_generation
+        # Only recorded once the whole update succeeds, as self.data is kept
+        # unchanged when it fails
+        read_at: dict[ReadBlock, float] = {}
 
         try:
-            # Read primary control (1-34)
-            data.update(await self.client.read(registers.REG_POWER, 34))
+            for block in self._read_plan:
+                if self._reuse_fresh_block(block, data, started):
+                    continue
+                await self._read_block(block, data)
+                read_at[block] = started
 
-            # Read connectivity, extra control (35-44)
-            # This has not been tested yet, it may be implemented in the future
-
-            # Read modes (100-158)
-            data.update(await self.client.read(registers.REG_AWAY_FAN_SUPPLY, 59))
-
-            # Read humidity setpoints (159-162)
-            # This has not been tested yet, it may be implemented in the future
-
-            # Read Eco and air quality (200-217)
-            if (
-                self.controller in {Controller.C6, Controller.C6M}
-                and self.func_version < FUNC_VER_AQ_HUMIDITY
-            ):
-                data.update(await self.client.read(registers.REG_ECO_MIN_TEMP, 15))
-            else:
-                data.update(await self.client.read(registers.REG_ECO_MIN_TEMP, 18))
-
-            # Skip scheduler (300-555)
-
-            # Read active alarms (600-610)
-            data.update(await self.client.read(registers.REG_ACTIVE_ALARMS_COUNT, 11))
-
-            # Skip alarm history (611-861)
-
-            # Read monitoring (900-957)
-            if (
-                self.controller in {Controller.C6, Controller.C6M}
-                and self.func_version < FUNC_VER_AQ_HUMIDITY
-            ):
-                data.update(await self.client.read(registers.REG_STATUS, 56))
-            else:
-                data.update(await self.client.read(registers.REG_STATUS, 58))
-
-            # Read digital outputs (958-960)
-            # This has not been tested yet, it may be implemented in the future
-
-            # Read exhaust temperature (961)
-            if (
-                self.controller in {Controller.C6, Controller.C6M}
-                and self.func_version >= FUNC_VER_EXHAUST_TEMP
-            ):
-                try:
-                    data.update(await self.client.read(registers.REG_EXHAUST_TEMP, 1))
-                except (ConnectionError, ModbusException) as error:
-                    _LOGGER.debug("Failed to read exhaust temperature: %s", error)
-
-            # Read controller firmware version (1000-1001)
-            try:
-                data.update(await self.client.read(registers.REG_FIRMWARE, 2))
-            except (ConnectionError, ModbusException) as error:
-                _LOGGER.warning("Failed to read controller firmware version: %s", error)
-
-            # Read panel 1 firmware version (1002-1003)
-            if data.get(registers.REG_CONNECTED_PANELS, 0) in [
-                ConnectedPanels.PANEL1,
-                ConnectedPanels.BOTH,
-            ]:
-                try:
-                    data.update(await self.client.read(registers.REG_PANEL1_FW, 2))
-                except (ConnectionError, ModbusException) as error:
-                    _LOGGER.warning(
-                        "Failed to read panel 1 firmware version: %s", error
-                    )
-
-            # Read panel 2 firmware version (1004-1005)
-            if data.get(registers.REG_CONNECTED_PANELS, 0) in [
-                ConnectedPanels.PANEL2,
-                ConnectedPanels.BOTH,
-            ]:
-                try:
-                    data.update(await self.client.read(registers.REG_PANEL2_FW, 2))
-                except (ConnectionError, ModbusException) as error:
-                    _LOGGER.warning(
-                        "Failed to read panel 2 firmware version: %s", error
-                    )
+            # Read panel firmware versions (1002-1005) when panels change
+            connected_panels = data.get(registers.REG_CONNECTED_PANELS, 0)
+            if connected_panels != self._static_panels:
+                await self._read_panel_firmware(connected_panels)
 
         except (ConnectionError, ModbusException) as error:
-            _LOGGER.warning("Error communicating with Komfovent: %s", error)
+            self._back_off()
+            # Only warn once per outage, repeated failures are logged at debug
+            _LOGGER.log(
+                logging.WARNING if self._consecutive_failures == 1 else logging.DEBUG,
+                "Error communicating with Komfovent (%d consecutive failures): %s",
+                self._consecutive_failures,
+                error,
+            )
             raise UpdateFailed from error
 
+        # Values read before a write during this update may already be stale
+        if generation == self._read_generation:
+            self._read_at.update(read_at)
+        self._adapt_update_interval(time.monotonic() - started)
+        data.update(self._static)
         self._apply_ema_on_update_data(data)
         return data
 
@@ -207,15 +402,13 @@ class KomfoventCoordinator(TimestampDataUpdateCoordinator[dict[int, Any]]):
             return
 
         dt = (utcnow() - self.last_update_success_time).total_seconds()
+        # All registers were read at the same time, so they share one alpha
+        alpha = ema_alpha(self.ema_time_constant, dt)
+        previous = self.data
 
         for reg in registers.REGISTERS_APPLY_EMA:
-            if reg in data:
-                data[reg] = apply_ema(
-                    current=data[reg],
-                    previous=self.data.get(reg),
-                    tau=self.ema_time_constant,
-                    dt=dt,
-                )
+            if reg in data and (prev := previous.get(reg)) is not None:
+                data[reg] = apply_ema_alpha(data[reg], prev, alpha)
 
 
 @dataclass
@@ -228,6 +421,8 @@ class KomfoventRuntimeData:
     """
 
     coordinator: KomfoventCoordinator
+    # time.monotonic() and result of the last diagnostics register dump
+    register_dump: tuple[float, dict[int, list[int]]] | None = None
 
 
 type KomfoventConfigEntry = ConfigEntry[KomfoventRuntimeData]
@@ -34,8 +34,45 @@ def apply_ema(
     if tau <= 0 or previous is None:
         return current
 
-    # Calculate smoothing factor alpha
-    alpha = dt / (tau + dt)
+    return apply_ema_alpha(current, previous, ema_alpha(tau, dt), precision)
 
+
+def ema_alpha(tau: int, dt: float) -> float:
+    """
+    Calculate the EMA smoothing factor for a time constant and time delta.
+
+    Args:
+        tau: Time constant in seconds (must be positive).
+        dt: Time delta since last update in seconds.
+
+    Returns:
+        Smoothing factor alpha = dt / (tau + dt).
+
+    """
+    return dt / (tau + dt)
+
+
+def apply_ema_alpha(
+    current: float,
+    previous: float,
+    alpha: float,
+    precision: int = 2,
+) -> float:
+    """
+    Apply Exponential Moving Average filter with a precalculated alpha.
+
+    Use this when filtering several readings taken at the same time, so the
+    smoothing factor is only calculated once.
+
+    Args:
+        current: Current raw reading from sensor.
+        previous: Previous EMA value.
+        alpha: Smoothing factor from ema_alpha.
+        precision: Decimal places to round result.
+
+    Returns:
+        Filtered value.
+
+    """
     # Apply EMA filter and round to avoid floating point precision issues
     return round(alpha * current + (1 - alpha) * previous, precision)
@@ -17,7 +17,6 @@ if TYPE_CHECKING:
     from .coordinator import KomfoventConfigEntry, KomfoventCoordinator
 
 from . import registers
-from .helpers import build_device_info
 
 
 async def async_setup_entry(
@@ -76,7 +75,23 @@ class KomfoventDateTime(CoordinatorEntity["KomfoventCoordinator"], DateTimeEntit
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
+        self._tz_name: str | None = None
+        self._local_epoch: datetime | None = None
+
+    def _get_local_epoch(self) -> datetime:
+        """
+        Return 1970-01-01 00:00:00 in the Home Assistant time zone.
+
+        The zone and epoch are cached and only rebuilt when the configured time
+        zone changes.
+        """
+        tz_name = str(self.coordinator.hass.config.time_zone)
+        if self._local_epoch is None or tz_name != self._tz_name:
+            local_tz = zoneinfo.ZoneInfo(tz_name)
+            self._local_epoch = datetime(1970, 1, 1, tzinfo=local_tz)
+            self._tz_name = tz_name
+        return self._local_epoch
 
     @property
     def native_value(self) -> datetime | None:
@@ -89,24 +104,18 @@ class KomfoventDateTime(CoordinatorEntity["KomfoventCoordinator"], DateTimeEntit
             return None
 
         try:
-            # Initialize local epoch (1970-01-01 00:00:00 in local timezone)
-            local_tz = zoneinfo.ZoneInfo(str(self.coordinator.hass.config.time_zone))
-            local_epoch = datetime(1970, 1, 1, tzinfo=local_tz)
-
             # Convert seconds since local epoch to datetime
-            return local_epoch + timedelta(seconds=value)
+            return self._get_local_epoch() + timedelta(seconds=value)
         except (ValueError, TypeError, OSError):
             return None
 
     async def async_set_value(self, value: datetime) -> None:
         """Update the datetime value."""
-        # Initialize local epoch (1970-01-01 00:00:00 in local timezone)
-        local_tz = zoneinfo.ZoneInfo(str(self.coordinator.hass.config.time_zone))
-        local_epoch = datetime(1970, 1, 1, tzinfo=local_tz)
+        local_epoch = self._get_local_epoch()
 
         if not value.tzinfo:
             # If datetime has no timezone, assume local timezone
-            value = value.replace(tzinfo=local_tz)
+            value = value.replace(tzinfo=local_epoch.tzinfo)
 
         # Calculate seconds since local epoch
         seconds = int((value - local_epoch).total_seconds())
@@ -3,19 +3,19 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.const import CONF_HOST, CONF_PORT
 from pymodbus import ModbusException
-from pymodbus.client import AsyncModbusTcpClient
 
+from .modbus import MAX_READ_COUNT
 from .registers import REGISTERS_32BIT_UNSIGNED
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
-    from pymodbus.pdu import ModbusPDU
 
     from .coordinator import KomfoventConfigEntry
+    from .modbus import KomfoventModbusClient
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +26,8 @@ INTEGRATION_RANGES = [
     (100, 59),  # modes 100-158
     (159, 4),  # humidity setpoints 159-162
     (200, 18),  # eco and air quality 200-217
-    (300, 100),  # scheduler 300-555
-    (400, 100),  # scheduler 400-555
+    (300, 100),  # scheduler 300-399
+    (400, 100),  # scheduler 400-499
     (500, 56),  # scheduler 500-555
     (600, 11),  # active alarms 600-610
     (611, 89),  # alarm history 611-699
@@ -62,84 +62,129 @@ MOBILE_APP_RANGES = [
 UNKNOWN_RANGES = []
 RANGES = INTEGRATION_RANGES + MOBILE_APP_RANGES + UNKNOWN_RANGES
 
+# Seconds a register dump is reused by repeated diagnostics downloads
+DUMP_MAX_AGE = 60
+
 # Error messages
-ERR_READ_FAILED = "read failed"
+ERR_NOT_CONNECTED = "Not connected to Komfovent device"
+ERR_MERGED_READ = "Registers %d-%d: merged read failed"
 ERR_BLOCK_READ = "Register %d: block read failed"
 ERR_INDIVIDUAL_READ = "Register %d: individual read failed"
 
 
-def _check_response(response: ModbusPDU) -> None:
-    """Check if response has error and raise if needed."""
-    if response.isError():
-        raise ModbusException(ERR_READ_FAILED)
+def merge_ranges(
+    ranges: list[tuple[int, int]],
+) -> list[tuple[int, int, list[tuple[int, int]]]]:
+    """
+    Merge adjacent or overlapping register ranges into larger reads.
 
+    Args:
+        ranges: (start, count) register ranges, in any order
+
+    Returns:
+        List of (start, count, ranges) reads, each covering one or more of the
+        given ranges and spanning at most MAX_READ_COUNT registers
 
-async def dump_registers(host: str, port: int) -> dict[int, list[int]]:
     """
-    Query all holding registers one by one and return values as dictionary.
+    merged: list[tuple[int, int, list[tuple[int, int]]]] = []
+    for start, count in sorted(ranges):
+        if merged:
+            merged_start, merged_count, members = merged[-1]
+            merged_end = max(merged_start + merged_count, start + count)
+            if (
+                start <= merged_start + merged_count
+                and merged_end - merged_start <= MAX_READ_COUNT
+            ):
+                members.append((start, count))
+                merged[-1] = (merged_start, merged_end - merged_start, members)
+                continue
+        merged.append((start, count, [(start, count)]))
+    return merged
+
+
+# Reads issued by dump_registers, merged once at import
+MERGED_RANGES = merge_ranges(RANGES)
+
+
+async def _read_range(
+    client: KomfoventModbusClient,
+    start: int,
+    count: int,
+    results: dict[int, list[int]],
+) -> None:
+    """Read a register range, falling back to individual reads on failure."""
+    try:
+        # try to read the whole block
+        results[start] = values = await client.read_raw(start, count)
+        logger.debug("Register %d: %s", start, values)
+    except ModbusException:
+        logger.warning(ERR_BLOCK_READ, start)
+
+        # fall back to individual reads
+        attempted = set()
+        for reg in range(start, start + count):
+            if reg in attempted:
+                continue
+
+            try:
+                if reg in REGISTERS_32BIT_UNSIGNED:
+                    # read 2 registers for 32-bit unsigned values
+                    values = await client.read_raw(reg, 2)
+                    attempted.add(reg)
+                    attempted.add(reg + 1)
+                else:
+                    # read 1 register for other values
+                    values = await client.read_raw(reg, 1)
+                    attempted.add(reg)
+
+                results[reg] = values
+                logger.debug("Register %d: %s", reg, values)
+            except ModbusException:
+                logger.warning(ERR_INDIVIDUAL_READ, reg)
+
+
+async def dump_registers(client: KomfoventModbusClient) -> dict[int, list[int]]:
+    """
+    Query all holding registers and return values as dictionary.
+
+    The integration's own connection is reused, so the device does not have to
+    accept a second Modbus session. Each request takes the client lock, which
+    keeps the dump from interleaving with coordinator polls.
+
+    Adjacent ranges are fetched with a single request and split back into the
+    original ranges. If a merged read fails, its ranges are read one by one.
 
     Args:
-        host: Modbus TCP host address
-        port: Modbus TCP port number
+        client: Connected Komfovent Modbus client
 
     Returns:
         Dictionary mapping register numbers to list of register values
 
     Raises:
-        ConnectionError: If connection to device fails
+        ConnectionError: If the client is not connected to the device
         ModbusException: If there is an error reading registers
 
     """
-    client = AsyncModbusTcpClient(host=host, port=port)
-
-    error_msg = f"Failed to connect to {host}:{port}"
-    if not await client.connect():
-        raise ConnectionError(error_msg)
+    if not client.connected:
+        raise ConnectionError(ERR_NOT_CONNECTED)
 
     results: dict[int, list[int]] = {}
-    try:
-        for start, count in RANGES:
+    for start, count, members in MERGED_RANGES:
+        if len(members) > 1:
             try:
-                # try to read the whole block
-                response = await client.read_holding_registers(
-                    address=start - 1, count=count
-                )
-                _check_response(response)
-
-                results[start] = response.registers
-                logger.info("Register %d: %s", start, response.registers)
+                words = await client.read_raw(start, count)
             except ModbusException:
-                logger.warning(ERR_BLOCK_READ, start)
-
-                # fall back to individual reads
-                attempted = set()
-                for reg in range(start, start + count):
-                    if reg in attempted:
-                        continue
-
-                    try:
-                        if reg in REGISTERS_32BIT_UNSIGNED:
-                            # read 2 registers for 32-bit unsigned values
-                            response = await client.read_holding_registers(
-                                address=reg - 1, count=2
-                            )
-                            attempted.add(reg)
-                            attempted.add(reg + 1)
-                        else:
-                            # read 1 register for other values
-                            response = await client.read_holding_registers(
-                                address=reg - 1, count=1
-                            )
-                            attempted.add(reg)
-                        _check_response(response)
-
-                        results[reg] = response.registers
-                        logger.info("Register %d: %s", reg, response.registers)
-                    except ModbusException:
-                        logger.warning(ERR_INDIVIDUAL_READ, reg)
-
-    finally:
-        client.close()
+                logger.warning(ERR_MERGED_READ, start, start + count - 1)
+            else:
+                for member_start, member_count in members:
+                    offset = member_start - start
+                    values = words[offset : offset + member_count]
+                    results[member_start] = values
+                    logger.debug("Register %d: %s", member_start, values)
+                continue
+
+        for member_start, member_count in members:
+            await _read_range(client, member_start, member_count, results)
 
     return results
 
@@ -149,16 +194,22 @@ async def async_get_config_entry_diagnostics(
     entry: KomfoventConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator = entry.runtime_data.coordinator
-
-    host = entry.data[CONF_HOST]
-    port = entry.data[CONF_PORT]
-
-    try:
-        registers = await dump_registers(host, port)
-    except (ConnectionError, ModbusException):
-        logger.exception("Failed to dump registers")
-        registers = {}
+    runtime_data = entry.runtime_data
+    coordinator = runtime_data.coordinator
+
+    # Reuse a recent dump, a full register sweep takes several seconds
+    now = time.monotonic()
+    cached = runtime_data.register_dump
+    if cached is not None and now - cached[0] < DUMP_MAX_AGE:
+        registers = cached[1]
+    else:
+        try:
+            registers = await dump_registers(coordinator.client)
+        except (ConnectionError, ModbusException):
+            logger.exception("Failed to dump registers")
+            registers = {}
+        else:
+            runtime_data.register_dump = (now, registers)
 
     return {
         "config_entry": entry.as_dict(),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_HOST
@@ -12,6 +13,10 @@ from .const import DOMAIN, Controller, Panel
 if TYPE_CHECKING:
     from .coordinator import KomfoventCoordinator
 
+# Device-type nibble of a packed firmware version to controller and panel type
+_CONTROLLERS = {controller.value: controller for controller in Controller}
+_PANELS = {panel.value: panel for panel in Panel}
+
 
 def build_device_info(coordinator: KomfoventCoordinator) -> DeviceInfo:
     """
@@ -71,6 +76,7 @@ def _unpack_version(value: int) -> tuple[int, int, int, int, int]:
     return device_type, v1, v2, v3, v4
 
 
+@lru_cache(maxsize=16)
 def get_controller_version(value: int) -> tuple[Controller, int, int, int, int]:
     """
     Convert integer version to a controller version tuple.
@@ -83,15 +89,11 @@ def get_controller_version(value: int) -> tuple[Controller, int, int, int, int]:
 
     """
     device_type, v1, v2, v3, v4 = _unpack_version(value)
-
-    try:
-        controller = Controller(device_type)
-    except ValueError:
-        controller = Controller.NA
-
+    controller = _CONTROLLERS.get(device_type, Controller.NA)
     return controller, v1, v2, v3, v4
 
 
+@lru_cache(maxsize=16)
 def get_panel_version(value: int) -> tuple[Panel, int, int, int, int]:
     """
     Convert integer version to a control panel version tuple.
@@ -107,10 +109,5 @@ def get_panel_version(value: int) -> tuple[Panel, int, int, int, int]:
 
     """
     device_type, v1, v2, v3, v4 = _unpack_version(value)
-
-    try:
-        panel = Panel(device_type)
-    except ValueError:
-        panel = Panel.NA
-
+    panel = _PANELS.get(device_type, Panel.NA)
     return panel, v1, v2, v3, v4
@@ -2,50 +2,96 @@
 
 import asyncio
 import logging
+from functools import cache
+from typing import Any, NamedTuple
 
 from pymodbus import ModbusException
 from pymodbus.client import AsyncModbusTcpClient
 
-from .registers import (
-    REGISTERS_16BIT_SIGNED,
-    REGISTERS_16BIT_UNSIGNED,
-    REGISTERS_32BIT_UNSIGNED,
-)
+from .registers import REGISTER_TYPES, RegisterType
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of registers in a single Modbus "read holding registers" request
+MAX_READ_COUNT = 125
 
-def convert_register_block(block: dict[int, int]) -> dict[int, int]:
-    """Apply signed and 32-bit conversions to a raw uint16 register block."""
-    converted: set[int] = set()
-    data: dict[int, int] = {}
-
-    for reg, value in block.items():
-        if reg in REGISTERS_16BIT_UNSIGNED:
-            # For 16-bit unsigned registers, use value directly
-            converted.add(reg)
-            data[reg] = value
-        elif reg in REGISTERS_16BIT_SIGNED:
-            # For 16-bit signed registers, convert uint16 to int16
-            converted.add(reg)
-            data[reg] = value - (value >> 15 << 16)
-        elif reg in REGISTERS_32BIT_UNSIGNED:
-            # For 32-bit registers, combine with next register
-            if reg + 1 not in block:
-                msg = f"Register {reg + 1} value not retrieved"
-                raise ValueError(msg)
-            converted.add(reg)
-            converted.add(reg + 1)
-            data[reg] = (value << 16) + block[reg + 1]
-
-    if not_converted := set(block.keys()) - converted:
+
+class BlockLayout(NamedTuple):
+    """Word offsets of each register type within a read window."""
+
+    uint16: tuple[int, ...]
+    int16: tuple[int, ...]
+    uint32: tuple[int, ...]
+
+
+@cache
+def _block_layout(start: int, count: int) -> BlockLayout:
+    """
+    Return the offsets of the registers starting in a window, split by type.
+
+    The layout only depends on the window, so it is computed once per distinct
+    (start, count) read and reused on every following poll.
+
+    Args:
+        start: First register number of the window
+        count: Number of registers in the window
+
+    Returns:
+        Offsets relative to start for each register type, in address order
+
+    """
+    offsets: dict[RegisterType, list[int]] = {reg_type: [] for reg_type in RegisterType}
+    not_converted: set[int] = set()
+    offset = 0
+
+    while offset < count:
+        reg = start + offset
+        reg_type = REGISTER_TYPES.get(reg)
+        if reg_type is None:
+            not_converted.add(reg)
+            offset += 1
+            continue
+        if reg_type is RegisterType.UINT32 and offset + 1 >= count:
+            msg = f"Register {reg + 1} value not retrieved"
+            raise ValueError(msg)
+        offsets[reg_type].append(offset)
+        offset += 2 if reg_type is RegisterType.UINT32 else 1
+
+    if not_converted:
         msg = (
             f"Registers {not_converted} not found in either "
             "16-bit or 32-bit register sets"
         )
         raise NotImplementedError(msg)
 
-    return data
+    return BlockLayout(
+        uint16=tuple(offsets[RegisterType.UINT16]),
+        int16=tuple(offsets[RegisterType.INT16]),
+        uint32=tuple(offsets[RegisterType.UINT32]),
+    )
+
+
+def decode_registers_into(start: int, words: list[int], out: dict[int, Any]) -> None:
+    """
+    Convert a contiguous list of raw uint16 words and store them in out.
+
+    Each register type is converted in its own loop over precomputed offsets,
+    so the per-register work has no type dispatch. Values are written straight
+    into out, without building an intermediate dictionary.
+
+    Args:
+        start: Register number of the first word
+        words: Raw register values as returned by the device
+        out: Dictionary receiving converted values keyed by register number
+
+    """
+    layout = _block_layout(start, len(words))
+    for i in layout.uint16:
+        out[start + i] = words[i]
+    for i in layout.int16:
+        out[start + i] = (words[i] ^ 0x8000) - 0x8000
+    for i in layout.uint32:
+        out[start + i] = (words[i] << 16) | words[i + 1]
 
 
 class KomfoventModbusClient:
@@ -71,8 +117,23 @@ class KomfoventModbusClient:
         """Close the Modbus connection."""
         self.client.close()
 
+    @property
+    def connected(self) -> bool:
+        """Return True if the Modbus connection is open."""
+        return self.client.connected
+
     async def read(self, register: int, count: int) -> dict[int, int]:
         """Read holding registers and return dict keyed by absolute register numbers."""
+        data: dict[int, int] = {}
+        await self.read_into(register, count, data)
+        return data
+
+    async def read_into(self, register: int, count: int, out: dict[int, Any]) -> None:
+        """Read holding registers into out, keyed by absolute register numbers."""
+        decode_registers_into(register, await self.read_raw(register, count), out)
+
+    async def read_raw(self, register: int, count: int) -> list[int]:
+        """Read holding registers and return the raw uint16 words."""
         async with self._lock:
             result = await self.client.read_holding_registers(
                 address=register - 1, count=count
@@ -82,20 +143,20 @@ class KomfoventModbusClient:
             msg = f"Error reading registers at {register}"
             raise ModbusException(msg)
 
-        block = dict(enumerate(result.registers, start=register))
-        return convert_register_block(block)
+        return result.registers
 
     async def write(self, register: int, value: int) -> None:
         """Write to holding register."""
+        reg_type = REGISTER_TYPES.get(register)
         async with self._lock:
-            if register in REGISTERS_16BIT_UNSIGNED:
+            if reg_type is RegisterType.UINT16:
                 # Write unsigned value as-is
                 result = await self.client.write_register(register - 1, value)
-            elif register in REGISTERS_16BIT_SIGNED:
+            elif reg_type is RegisterType.INT16:
                 # Convert signed value to 16-bit unsigned for Modbus
                 unsigned_value = value & 0xFFFF
                 result = await self.client.write_register(register - 1, unsigned_value)
-            elif register in REGISTERS_32BIT_UNSIGNED:
+            elif reg_type is RegisterType.UINT32:
                 # Split 32-bit value into two 16-bit values
                 high_word = (value >> 16) & 0xFFFF
                 low_word = value & 0xFFFF
@@ -44,7 +44,6 @@ from .const import (
     FlowControl,
     FlowUnit,
 )
-from .helpers import build_device_info
 from .registers import REG_ECO_MAX_TEMP, REG_ECO_MIN_TEMP
 
 AQ_INTENSITY_MIN = 20
@@ -651,7 +650,7 @@ class KomfoventNumber(CoordinatorEntity["KomfoventCoordinator"], NumberEntity):
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
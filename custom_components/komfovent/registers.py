@@ -7,6 +7,8 @@ with Komfovent ventilation units via Modbus TCP.
 
 from __future__ import annotations
 
+from enum import IntEnum
+
 # Modbus registers - Basic Control
 REG_POWER = 1  # ON/OFF status
 REG_AUTO_MODE_CONTROL = 2  # Auto mode control
@@ -421,3 +423,19 @@ REGISTERS_APPLY_EMA = {
     REG_SPI,
     REG_ENERGY_SAVING,
 }
+
+
+class RegisterType(IntEnum):
+    """Wire encoding of a holding register value."""
+
+    UINT16 = 0
+    INT16 = 1
+    UINT32 = 2
+
+
+# Register type per (first) register address, derived from the sets above
+REGISTER_TYPES: dict[int, RegisterType] = {
+    **dict.fromkeys(REGISTERS_16BIT_UNSIGNED, RegisterType.UINT16),
+    **dict.fromkeys(REGISTERS_16BIT_SIGNED, RegisterType.INT16),
+    **dict.fromkeys(REGISTERS_32BIT_UNSIGNED, RegisterType.UINT32),
+}
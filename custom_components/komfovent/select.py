@@ -27,7 +27,6 @@ from .const import (
     SchedulerMode,
     TemperatureControl,
 )
-from .helpers import build_device_info
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -244,7 +243,7 @@ class KomfoventSelect(CoordinatorEntity["KomfoventCoordinator"], SelectEntity):
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def current_option(self) -> str | None:
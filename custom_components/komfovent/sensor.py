@@ -25,7 +25,7 @@ from homeassistant.const import (
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .helpers import build_device_info, get_controller_version, get_panel_version
+from .helpers import get_controller_version, get_panel_version
 
 if TYPE_CHECKING:
     from decimal import Decimal
@@ -39,6 +39,8 @@ if TYPE_CHECKING:
 from . import registers
 from .const import (
     ALARM_CODE_MESSAGES,
+    PANEL1_CONNECTED,
+    PANEL2_CONNECTED,
     AirQualitySensorType,
     ConnectedPanels,
     Controller,
@@ -712,10 +714,10 @@ async def create_sensors(coordinator: KomfoventCoordinator) -> list[KomfoventSen
         )
 
     # Add panel 1 sensors if panel is present
-    if coordinator.data and coordinator.data.get(registers.REG_CONNECTED_PANELS) in [
-        ConnectedPanels.PANEL1,
-        ConnectedPanels.BOTH,
-    ]:
+    if (
+        coordinator.data
+        and coordinator.data.get(registers.REG_CONNECTED_PANELS) in PANEL1_CONNECTED
+    ):
         entities.extend(
             [
                 TemperatureSensor(
@@ -755,10 +757,10 @@ async def create_sensors(coordinator: KomfoventCoordinator) -> list[KomfoventSen
         )
 
     # Add panel 2 sensors if panel is present
-    if coordinator.data and coordinator.data.get(registers.REG_CONNECTED_PANELS) in [
-        ConnectedPanels.PANEL2,
-        ConnectedPanels.BOTH,
-    ]:
+    if (
+        coordinator.data
+        and coordinator.data.get(registers.REG_CONNECTED_PANELS) in PANEL2_CONNECTED
+    ):
         entities.extend(
             [
                 TemperatureSensor(
@@ -850,7 +852,7 @@ class KomfoventSensor(CoordinatorEntity["KomfoventCoordinator"], SensorEntity):
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
@@ -15,7 +15,6 @@ if TYPE_CHECKING:
     from .coordinator import KomfoventConfigEntry, KomfoventCoordinator
 
 from . import registers
-from .helpers import build_device_info
 
 
 async def create_switches(coordinator: KomfoventCoordinator) -> list[KomfoventSwitch]:
@@ -232,7 +231,7 @@ class KomfoventSwitch(CoordinatorEntity["KomfoventCoordinator"], SwitchEntity):
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
         self._attr_translation_key = entity_description.key
-        self._attr_device_info = build_device_info(coordinator)
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
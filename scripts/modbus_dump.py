@@ -11,9 +11,25 @@ from pathlib import Path
 from pymodbus.exceptions import ModbusException
 
 from custom_components.komfovent.diagnostics import dump_registers
+from custom_components.komfovent.modbus import KomfoventModbusClient
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
+# Show each register as it is read, the integration logs them at debug level
+logging.getLogger("custom_components.komfovent.diagnostics").setLevel(logging.DEBUG)
+
+
+async def dump(host: str, port: int) -> dict[int, list[int]]:
+    """Connect to the device and dump its registers."""
+    client = KomfoventModbusClient(host, port)
+    if not await client.connect():
+        msg = f"Failed to connect to {host}:{port}"
+        raise ConnectionError(msg)
+
+    try:
+        return await dump_registers(client)
+    finally:
+        await client.close()
 
 
 def main() -> None:
@@ -28,7 +44,7 @@ def main() -> None:
     try:
         logger.info("Connecting to %s:%d...", args.host, args.port)
         logger.info("Starting register scan (this may take a few minutes)...")
-        registers = asyncio.run(dump_registers(args.host, args.port))
+        registers = asyncio.run(dump(args.host, args.port))
 
         output_path = Path(args.output)
         with output_path.open("w") as f:
@@ -9,21 +9,11 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.komfovent.const import DOMAIN, Controller
-from custom_components.komfovent.modbus import convert_register_block
-from custom_components.komfovent.registers import (
-    REGISTERS_16BIT_SIGNED,
-    REGISTERS_16BIT_UNSIGNED,
-    REGISTERS_32BIT_UNSIGNED,
-)
+from custom_components.komfovent.helpers import build_device_info
+from custom_components.komfovent.modbus import decode_registers_into
+from custom_components.komfovent.registers import REGISTER_TYPES, RegisterType
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
-_CLASSIFIED_REGISTERS = (
-    REGISTERS_16BIT_UNSIGNED
-    | REGISTERS_16BIT_SIGNED
-    | REGISTERS_32BIT_UNSIGNED
-    # high-word slots needed by convert_register_block for 32-bit combine
-    | {reg + 1 for reg in REGISTERS_32BIT_UNSIGNED}
-)
 
 
 def load_register_fixture(fixture_name: str) -> dict[int, int]:
@@ -50,9 +40,15 @@ def load_register_fixture(fixture_name: str) -> dict[int, int]:
         reg: value
         for block_start, values in register_data.items()
         for reg, value in enumerate(values, start=int(block_start))
-        if reg in _CLASSIFIED_REGISTERS
     }
-    return convert_register_block(raw)
+
+    # Decode each known register on its own, undocumented ones are dropped
+    data: dict[int, int] = {}
+    for reg, reg_type in REGISTER_TYPES.items():
+        words = range(reg, reg + (2 if reg_type is RegisterType.UINT32 else 1))
+        if all(word in raw for word in words):
+            decode_registers_into(reg, [raw[word] for word in words], data)
+    return data
 
 
 def get_controller_from_fixture_name(fixture_name: str) -> Controller:
@@ -121,6 +117,7 @@ def mock_coordinator(hass, mock_config_entry):
     coordinator.data = load_register_fixture("C6_registers_0.json")
     coordinator.controller = Controller.C6
     coordinator.func_version = 67
+    coordinator.device_info = build_device_info(coordinator)
 
     # Mock the client
     coordinator.client = MagicMock()
@@ -153,6 +150,7 @@ def mock_coordinator_by_controller(request, hass, mock_config_entry):
     coordinator.data = load_register_fixture(fixture_name)
     coordinator.controller = controller
     coordinator.func_version = 67
+    coordinator.device_info = build_device_info(coordinator)
 
     # Mock the client
     coordinator.client = MagicMock()
@@ -193,7 +191,11 @@ def mock_modbus_client() -> MagicMock:
             if register <= reg < register + count
         }
 
+    async def mock_read_into(register: int, count: int, out: dict[int, int]) -> None:
+        out.update(await mock_read(register, count))
+
     mock_client.read = AsyncMock(side_effect=mock_read)
+    mock_client.read_into = AsyncMock(side_effect=mock_read_into)
     mock_client.write = AsyncMock()
 
     return mock_client
@@ -12,7 +12,10 @@ from custom_components.komfovent.binary_sensor import (
     BITMASK_FAN,
     BITMASK_HEATING,
 )
-from custom_components.komfovent.climate import KomfoventClimate
+from custom_components.komfovent.climate import (
+    MODE_TEMP_MAPPING_BY_CODE,
+    KomfoventClimate,
+)
 from custom_components.komfovent.const import DOMAIN, OperationMode, TemperatureControl
 
 # ==================== Data Tables ====================
@@ -64,6 +67,15 @@ class TestKomfoventClimate:
         assert HVACMode.HEAT_COOL in c.hvac_modes
 
 
+def test_mode_temp_mapping_by_code():
+    """Test the setpoint register is indexed by the raw operation mode value."""
+    assert len(MODE_TEMP_MAPPING_BY_CODE) == len(OperationMode)
+    for mode, register, _ in TARGET_TEMP_MODES:
+        assert MODE_TEMP_MAPPING_BY_CODE[mode.value] == register
+    for mode in (OperationMode.STANDBY, OperationMode.OFF):
+        assert MODE_TEMP_MAPPING_BY_CODE[mode.value] == registers.REG_NORMAL_SETPOINT
+
+
 # ==================== Property Tests ====================
 
 
@@ -204,9 +216,10 @@ async def test_set_temperature_boundaries(mock_coordinator, temp, should_write):
     assert mock_coordinator.client.write.called == should_write
 
 
-async def test_set_temperature_invalid_mode(mock_coordinator):
+@pytest.mark.parametrize("data", [{registers.REG_OPERATION_MODE: 99}, {}])
+async def test_set_temperature_invalid_mode(mock_coordinator, data):
     """Test set_temperature falls back to normal setpoint on invalid mode."""
-    mock_coordinator.data = {registers.REG_OPERATION_MODE: 99}
+    mock_coordinator.data = data
     await KomfoventClimate(mock_coordinator).async_set_temperature(
         **{ATTR_TEMPERATURE: 21.0}
     )
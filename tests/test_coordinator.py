@@ -1,17 +1,40 @@
 """Tests for the Komfovent coordinator."""
 
+import logging
+import time
 from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util.dt import utcnow
+from pymodbus.exceptions import ModbusException
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.komfovent.const import DOMAIN
-from custom_components.komfovent.coordinator import KomfoventCoordinator
-from custom_components.komfovent.registers import REG_SUPPLY_TEMP
+from custom_components.komfovent.const import (
+    DOMAIN,
+    MAX_UPDATE_INTERVAL,
+    SETTINGS_MAX_AGE,
+    ConnectedPanels,
+    Controller,
+)
+from custom_components.komfovent.coordinator import (
+    KomfoventCoordinator,
+    build_read_plan,
+)
+from custom_components.komfovent.registers import (
+    REG_AWAY_FAN_SUPPLY,
+    REG_CONNECTED_PANELS,
+    REG_ECO_MIN_TEMP,
+    REG_EXHAUST_TEMP,
+    REG_FIRMWARE,
+    REG_PANEL1_FW,
+    REG_PANEL2_FW,
+    REG_STATUS,
+    REG_SUPPLY_TEMP,
+)
 
 
 @pytest.fixture
@@ -24,12 +47,22 @@ def mock_config_entry():
     )
 
 
+def mock_reads(mock_client, **kwargs) -> None:
+    """Mock client reads, routing read_into through the read mock."""
+    mock_client.read = AsyncMock(**kwargs)
+
+    async def read_into(register: int, count: int, out: dict[int, int]) -> None:
+        out.update(await mock_client.read(register, count))
+
+    mock_client.read_into = AsyncMock(side_effect=read_into)
+
+
 async def test_coordinator_updates_data(hass: HomeAssistant, mock_config_entry) -> None:
     """Test that the coordinator can update and process data."""
     # Create mock client with required async methods
     mock_client = AsyncMock()
     mock_client.connect = AsyncMock()  # Should not raise exception
-    mock_client.read = AsyncMock(return_value={1: 42})
+    mock_reads(mock_client, return_value={1: 42})
 
     # Patch the client class where it's used
     with patch(
@@ -60,7 +93,7 @@ async def test_coordinator_handles_connection_failure(
     # Create mock client that fails to connect
     mock_client = AsyncMock()
     mock_client.connect = AsyncMock(side_effect=ConnectionError)
-    mock_client.read = AsyncMock(return_value={1: 42})
+    mock_reads(mock_client, return_value={1: 42})
 
     # Patch the client class where it's used
     with patch(
@@ -79,7 +112,7 @@ async def test_cooldown_delays_update(hass: HomeAssistant, mock_config_entry) ->
     """Test that cooldown delays the next update."""
     mock_client = AsyncMock()
     mock_client.connect = AsyncMock()
-    mock_client.read = AsyncMock(return_value={1: 42})
+    mock_reads(mock_client, return_value={1: 42})
 
     with (
         patch(
@@ -210,3 +243,444 @@ class TestEmaFiltering:
 
             # Non-EMA register should remain unchanged
             assert data[999] == 100
+
+    def test_ema_skips_registers_without_previous_value(
+        self, hass: HomeAssistant, mock_config_entry
+    ) -> None:
+        """Test EMA passes through registers missing from the previous poll."""
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=AsyncMock(),
+        ):
+            coordinator = KomfoventCoordinator(
+                hass, config_entry=mock_config_entry, ema_time_constant=300
+            )
+            coordinator.data = {}
+            coordinator.last_update_success_time = utcnow() - timedelta(seconds=30)
+
+            data = {REG_SUPPLY_TEMP: 250}
+            coordinator._apply_ema_on_update_data(data)
+
+            assert data[REG_SUPPLY_TEMP] == 250
+
+
+class TestReadPlan:
+    """Tests for the per-poll register read plan."""
+
+    @pytest.mark.parametrize(
+        ("controller", "func_version", "expected"),
+        [
+            (
+                Controller.C6,
+                20,
+                [(1, 34), (100, 59), (200, 15), (600, 11), (900, 56)],
+            ),
+            (
+                Controller.C6M,
+                51,
+                [(1, 34), (100, 59), (200, 18), (600, 11), (900, 58)],
+            ),
+            (
+                Controller.C6,
+                67,
+                [(1, 34), (100, 59), (200, 18), (600, 11), (900, 58), (961, 1)],
+            ),
+            (
+                Controller.C8,
+                67,
+                [(1, 34), (100, 59), (200, 18), (600, 11), (900, 58)],
+            ),
+        ],
+    )
+    def test_build_read_plan(self, controller, func_version, expected) -> None:
+        """Test the plan blocks per controller and firmware version."""
+        plan = build_read_plan(controller, func_version)
+        assert [(block.start, block.count) for block in plan] == expected
+
+    async def test_unreadable_exhaust_does_not_fail_monitoring(
+        self, hass: HomeAssistant, mock_config_entry
+    ) -> None:
+        """Test an unreadable optional block costs one request and is skipped."""
+
+        async def mock_read(register: int, count: int) -> dict[int, int]:
+            if register <= REG_EXHAUST_TEMP < register + count:
+                msg = "Illegal data address"
+                raise ModbusException(msg)
+            return {register: 1}
+
+        mock_client = AsyncMock()
+        mock_reads(mock_client, side_effect=mock_read)
+
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ):
+            coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+            coordinator._read_plan = build_read_plan(Controller.C6, 67)
+            data = await coordinator._async_update_data()
+
+        assert data[REG_STATUS] == 1
+        assert REG_EXHAUST_TEMP not in data
+        calls = [call.args for call in mock_client.read.call_args_list]
+        assert (REG_STATUS, 58) in calls
+        assert (REG_EXHAUST_TEMP, 1) in calls
+
+    async def test_required_block_failure_fails_update(
+        self, hass: HomeAssistant, mock_config_entry
+    ) -> None:
+        """Test a failed required block aborts the update."""
+        mock_client = AsyncMock()
+        mock_reads(mock_client, side_effect=ModbusException("timeout"))
+
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ):
+            coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+
+
+class TestStaticRegisters:
+    """Tests for firmware versions cached across polls."""
+
+    async def test_firmware_read_once(
+        self, hass: HomeAssistant, mock_config_entry
+    ) -> None:
+        """Test controller firmware is read on connect and reused each poll."""
+        mock_client = AsyncMock()
+        mock_reads(mock_client, return_value={REG_FIRMWARE: 0x12345678})
+
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ):
+            coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+            await coordinator.connect()
+            mock_client.read.reset_mock()
+            mock_client.read.return_value = {}
+            data = await coordinator._async_update_data()
+
+        assert data[REG_FIRMWARE] == 0x12345678
+        calls = [call.args[0] for call in mock_client.read.call_args_list]
+        assert REG_FIRMWARE not in calls
+
+    async def test_device_info_shared_until_firmware_refresh(
+        self, hass: HomeAssistant, mock_config_entry
+    ) -> None:
+        """Test entities share one device info, rebuilt when firmware is re-read."""
+        mock_client = AsyncMock()
+        mock_reads(mock_client, return_value={REG_FIRMWARE: 0x12345678})
+
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ):
+            coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+            device_info = coordinator.device_info
+            assert coordinator.device_info is device_info
+            assert device_info["model"] == "NA"
+
+            await coordinator.connect()
+
+        assert coordinator.device_info is not device_info
+        assert coordinator.device_info["model"] == coordinator.controller.name
+
+    async def test_panel_firmware_read_when_panels_change(
+        self, hass: HomeAssistant, mock_config_entry
+    ) -> None:
+        """Test panel firmware is read once per connected panels value."""
+        panels = {REG_CONNECTED_PANELS: ConnectedPanels.BOTH}
+
+        async def mock_read(register: int, count: int) -> dict[int, int]:
+            if register in (REG_PANEL1_FW, REG_PANEL2_FW):
+                return {
+                    reg: 1
+                    for reg in (REG_PANEL1_FW, REG_PANEL2_FW)
+                    if register <= reg < register + count
+                }
+            if register <= REG_CONNECTED_PANELS < register + count:
+                return dict(panels)
+            return {}
+
+        mock_client = AsyncMock()
+        mock_reads(mock_client, side_effect=mock_read)
+
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ):
+            coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+            await coordinator._async_update_data()
+            data = await coordinator._async_update_data()
+            assert data[REG_PANEL1_FW] == data[REG_PANEL2_FW] == 1
+
+            panels[REG_CONNECTED_PANELS] = ConnectedPanels.PANEL1
+            data = await coordinator._async_update_data()
+            assert REG_PANEL2_FW not in data
+
+        # Both panels in one request first, then panel 1 on its own
+        calls = [call.args for call in mock_client.read.call_args_list]
+        panel_calls = [args for args in calls if args[0] >= REG_PANEL1_FW]
+        assert panel_calls == [(REG_PANEL1_FW, 4), (REG_PANEL1_FW, 2)]
+
+    async def test_panel_firmware_falls_back_to_each_panel(
+        self, hass: HomeAssistant, mock_config_entry
+    ) -> None:
+        """Test a failed read of both panels retries each panel on its own."""
+
+        async def mock_read(register: int, count: int) -> dict[int, int]:
+            if register == REG_PANEL1_FW and count == 4:
+                msg = "Illegal data address"
+                raise ModbusException(msg)
+            if register in (REG_PANEL1_FW, REG_PANEL2_FW):
+                return {register: 1}
+            if register <= REG_CONNECTED_PANELS < register + count:
+                return {REG_CONNECTED_PANELS: ConnectedPanels.BOTH}
+            return {}
+
+        mock_client = AsyncMock()
+        mock_reads(mock_client, side_effect=mock_read)
+
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ):
+            coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+            data = await coordinator._async_update_data()
+
+        assert data[REG_PANEL1_FW] == data[REG_PANEL2_FW] == 1
+        calls = [call.args for call in mock_client.read.call_args_list]
+        panel_calls = [args for args in calls if args[0] >= REG_PANEL1_FW]
+        assert panel_calls == [
+            (REG_PANEL1_FW, 4),
+            (REG_PANEL1_FW, 2),
+            (REG_PANEL2_FW, 2),
+        ]
+
+    async def test_panel_firmware_retried_after_failure(
+        self, hass: HomeAssistant, mock_config_entry
+    ) -> None:
+        """Test a failed panel firmware read is retried on the next poll."""
+        failures = [ModbusException("timeout")]
+
+        async def mock_read(register: int, count: int) -> dict[int, int]:
+            if register == REG_PANEL1_FW:
+                if failures:
+                    raise failures.pop()
+                return {REG_PANEL1_FW: 1}
+            if register <= REG_CONNECTED_PANELS < register + count:
+                return {REG_CONNECTED_PANELS: ConnectedPanels.PANEL1}
+            return {}
+
+        mock_client = AsyncMock()
+        mock_reads(mock_client, side_effect=mock_read)
+
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ):
+            coordinator = KomfoventCoordinator(hass, config_entry=mock_config_entry)
+            data = await coordinator._async_update_data()
+            assert REG_PANEL1_FW not in data
+            data = await coordinator._async_update_data()
+            assert data[REG_PANEL1_FW] == 1
+
+
+class TestAdaptivePolling:
+    """Tests for the adaptive update interval and failure backoff."""
+
+    @pytest.fixture
+    def coordinator(self, hass: HomeAssistant, mock_config_entry):
+        """Create a coordinator with a 30 second base interval."""
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=AsyncMock(),
+        ):
+            return KomfoventCoordinator(
+                hass,
+                config_entry=mock_config_entry,
+                update_interval=timedelta(seconds=30),
+            )
+
+    def test_fast_polls_keep_base_interval(self, coordinator) -> None:
+        """Test the interval never drops below the configured one."""
+        coordinator._adapt_update_interval(0.2)
+        assert coordinator.update_interval == timedelta(seconds=30)
+
+    def test_slow_polls_widen_interval(self, coordinator) -> None:
+        """Test the interval widens to a multiple of the average poll time."""
+        for duration in (5.0, 10.0, 15.0, 20.0):
+            coordinator._adapt_update_interval(duration)
+        # Average of the last three samples is 15s
+        assert coordinator.update_interval == timedelta(seconds=60)
+
+        coordinator._adapt_update_interval(1000.0)
+        assert coordinator.update_interval == timedelta(seconds=MAX_UPDATE_INTERVAL)
+
+    def test_set_base_update_interval(self, coordinator) -> None:
+        """Test changing the base interval replaces a widened interval."""
+        coordinator._adapt_update_interval(20.0)
+        coordinator.set_base_update_interval(timedelta(seconds=120))
+        assert coordinator.base_update_interval == timedelta(seconds=120)
+        assert coordinator.update_interval == timedelta(seconds=120)
+
+    async def test_failures_keep_requested_cooldown(self, coordinator) -> None:
+        """Test failures leave the cooldown set after a write untouched."""
+        coordinator.set_cooldown(1.0)
+        deadline = coordinator._cooldown_until
+        mock_reads(coordinator.client, side_effect=ModbusException("timeout"))
+        with (
+            patch(
+                "custom_components.komfovent.coordinator.asyncio.sleep",
+                new=AsyncMock(),
+            ),
+            pytest.raises(UpdateFailed),
+        ):
+            await coordinator._async_update_data()
+        assert coordinator._cooldown_until == deadline
+
+        mock_reads(coordinator.client, return_value={})
+        await coordinator._async_update_data()
+        assert coordinator._consecutive_failures == 0
+
+    async def test_failures_warn_once_per_outage(self, coordinator, caplog) -> None:
+        """Test only the first failure of an outage is logged as a warning."""
+        mock_reads(coordinator.client, side_effect=ModbusException("timeout"))
+        with caplog.at_level(logging.DEBUG, logger="custom_components.komfovent"):
+            for _ in range(3):
+                with pytest.raises(UpdateFailed):
+                    await coordinator._async_update_data()
+        levels = [
+            record.levelno
+            for record in caplog.records
+            if "Error communicating" in record.message
+        ]
+        assert levels == [logging.WARNING, logging.DEBUG, logging.DEBUG]
+
+    async def test_failures_widen_update_interval(self, coordinator) -> None:
+        """Test failures double the interval up to the cap, success restores it."""
+        mock_reads(coordinator.client, side_effect=ModbusException("timeout"))
+        intervals = []
+        for _ in range(4):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+            intervals.append(coordinator.update_interval.total_seconds())
+        assert intervals == [60, 120, 240, MAX_UPDATE_INTERVAL]
+
+        mock_reads(coordinator.client, return_value={})
+        await coordinator._async_update_data()
+        assert coordinator.update_interval == timedelta(seconds=30)
+
+
+class TestSettingsReuse:
+    """Tests for reusing rarely changing setting blocks between polls."""
+
+    @pytest.fixture
+    def coordinator(self, hass: HomeAssistant, mock_config_entry):
+        """Create a coordinator whose reads return the start register."""
+        mock_client = AsyncMock()
+        mock_reads(mock_client, side_effect=lambda register, _count: {register: 1})
+        with patch(
+            "custom_components.komfovent.coordinator.KomfoventModbusClient",
+            return_value=mock_client,
+        ):
+            return KomfoventCoordinator(hass, config_entry=mock_config_entry)
+
+    @staticmethod
+    def read_starts(coordinator) -> list[int]:
+        """Return the start registers read since the last reset."""
+        return [call.args[0] for call in coordinator.client.read.call_args_list]
+
+    async def test_settings_reused_until_max_age(self, coordinator) -> None:
+        """Test mode and eco blocks are only re-read once they are too old."""
+        coordinator.data = await coordinator._async_update_data()
+        assert REG_AWAY_FAN_SUPPLY in self.read_starts(coordinator)
+
+        coordinator.client.read.reset_mock()
+        data = await coordinator._async_update_data()
+        starts = self.read_starts(coordinator)
+        assert REG_AWAY_FAN_SUPPLY not in starts
+        assert REG_ECO_MIN_TEMP not in starts
+        assert REG_STATUS in starts
+        assert data[REG_AWAY_FAN_SUPPLY] == data[REG_ECO_MIN_TEMP] == 1
+
+        coordinator.client.read.reset_mock()
+        later = time.monotonic() + SETTINGS_MAX_AGE
+        with patch(
+            "custom_components.komfovent.coordinator.time.monotonic",
+            return_value=later,
+        ):
+            await coordinator._async_update_data()
+        assert REG_AWAY_FAN_SUPPLY in self.read_starts(coordinator)
+
+    async def test_requested_refresh_rereads_settings(self, coordinator) -> None:
+        """Test a requested refresh, as done after writes, re-reads settings."""
+        coordinator.data = await coordinator._async_update_data()
+        with patch(
+            "homeassistant.helpers.update_coordinator."
+            "DataUpdateCoordinator.async_request_refresh",
+            new=AsyncMock(),
+        ) as mock_refresh:
+            await coordinator.async_request_refresh()
+        mock_refresh.assert_awaited_once()
+
+        coordinator.client.read.reset_mock()
+        await coordinator._async_update_data()
+        assert REG_AWAY_FAN_SUPPLY in self.read_starts(coordinator)
+
+    async def test_failed_update_does_not_mark_settings_fresh(
+        self, coordinator
+    ) -> None:
+        """Test settings read during a failed update are re-read on the next one."""
+
+        async def fail_monitoring(register: int, _count: int) -> dict[int, int]:
+            if register == REG_STATUS:
+                msg = "timeout"
+                raise ModbusException(msg)
+            return {register: 1}
+
+        coordinator.data = await coordinator._async_update_data()
+        # Settings are due for a re-read, e.g. after a write
+        coordinator._read_at.clear()
+
+        coordinator.client.read.reset_mock()
+        coordinator.client.read.side_effect = fail_monitoring
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert REG_AWAY_FAN_SUPPLY in self.read_starts(coordinator)
+
+        coordinator.client.read.side_effect = lambda register, _count: {register: 1}
+        coordinator.client.read.reset_mock()
+        await coordinator._async_update_data()
+        assert REG_AWAY_FAN_SUPPLY in self.read_starts(coordinator)
+        assert REG_ECO_MIN_TEMP in self.read_starts(coordinator)
+
+    async def test_refresh_requested_during_update_rereads_settings(
+        self, coordinator
+    ) -> None:
+        """Test settings read before a write in the same update are not reused."""
+
+        async def write_during_monitoring(register: int, _count: int) -> dict:
+            if register == REG_STATUS:
+                # A write lands after the modes block was already read
+                await coordinator.async_request_refresh()
+            return {register: 1}
+
+        coordinator.data = await coordinator._async_update_data()
+        coordinator._read_at.clear()
+
+        coordinator.client.read.side_effect = write_during_monitoring
+        with patch(
+            "homeassistant.helpers.update_coordinator."
+            "DataUpdateCoordinator.async_request_refresh",
+            new=AsyncMock(),
+        ):
+            coordinator.data = await coordinator._async_update_data()
+        assert coordinator._read_at == {}
+
+        coordinator.client.read.side_effect = lambda register, _count: {register: 1}
+        coordinator.client.read.reset_mock()
+        await coordinator._async_update_data()
+        assert REG_AWAY_FAN_SUPPLY in self.read_starts(coordinator)
+        assert REG_ECO_MIN_TEMP in self.read_starts(coordinator)
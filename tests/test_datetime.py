@@ -64,6 +64,16 @@ def test_native_value_edge_cases(mock_coordinator, data, expected):
     assert KomfoventDateTime(mock_coordinator, 100, DESC).native_value is expected
 
 
+def test_native_value_keeps_wall_clock_across_dst(mock_coordinator):
+    """Test seconds since the local epoch map to local wall-clock time in summer."""
+    # 2024-07-01 12:00 counted as wall-clock seconds from 1970-01-01 00:00
+    mock_coordinator.data = {100: 1719835200}
+    mock_coordinator.hass.config.time_zone = "Europe/Amsterdam"
+    tz = zoneinfo.ZoneInfo("Europe/Amsterdam")
+    expected = datetime(2024, 7, 1, 12, 0, tzinfo=tz)
+    assert KomfoventDateTime(mock_coordinator, 100, DESC).native_value == expected
+
+
 # ==================== Async Set Value Tests ====================
 
 
@@ -97,3 +107,27 @@ async def test_set_value_holidays_register(mock_coordinator):
     mock_coordinator.client.write.assert_called_once_with(
         registers.REG_HOLIDAYS_FROM, expected
     )
+
+
+# ==================== Local Epoch Cache Tests ====================
+
+
+def test_local_epoch_is_cached(mock_coordinator):
+    """Test the local epoch is reused while the time zone is unchanged."""
+    mock_coordinator.hass.config.time_zone = "Europe/Amsterdam"
+    dt = KomfoventDateTime(mock_coordinator, 100, DESC)
+    epoch = dt._get_local_epoch()
+    assert dt._get_local_epoch() is epoch
+    assert epoch.tzinfo == zoneinfo.ZoneInfo("Europe/Amsterdam")
+
+
+def test_local_epoch_follows_time_zone_change(mock_coordinator):
+    """Test the local epoch is rebuilt when the time zone changes."""
+    mock_coordinator.data = {100: 0}
+    mock_coordinator.hass.config.time_zone = "UTC"
+    dt = KomfoventDateTime(mock_coordinator, 100, DESC)
+    assert dt.native_value == datetime(1970, 1, 1, tzinfo=zoneinfo.ZoneInfo("UTC"))
+    mock_coordinator.hass.config.time_zone = "Asia/Tokyo"
+    assert dt.native_value == datetime(
+        1969, 12, 31, 15, tzinfo=zoneinfo.ZoneInfo("UTC")
+    )
@@ -1,5 +1,6 @@
 """Tests for Komfovent diagnostics."""
 
+from itertools import pairwise
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,14 +11,27 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.komfovent.const import DOMAIN
 from custom_components.komfovent.coordinator import KomfoventRuntimeData
 from custom_components.komfovent.diagnostics import (
-    ERR_READ_FAILED,
+    DUMP_MAX_AGE,
+    ERR_NOT_CONNECTED,
+    MERGED_RANGES,
     RANGES,
-    _check_response,
     async_get_config_entry_diagnostics,
     dump_registers,
+    merge_ranges,
 )
+from custom_components.komfovent.registers import REG_FIRMWARE
 
-MODBUS_CLIENT = "custom_components.komfovent.diagnostics.AsyncModbusTcpClient"
+DIAG_RANGES = "custom_components.komfovent.diagnostics.MERGED_RANGES"
+ERR_READ = "Error reading registers"
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock connected Komfovent Modbus client."""
+    client = MagicMock()
+    client.connected = True
+    client.read_raw = AsyncMock(return_value=[0])
+    return client
 
 
 @pytest.fixture
@@ -37,94 +51,123 @@ def mock_entry(hass):
 # ==================== Helper Tests ====================
 
 
-def test_check_response_valid():
-    """Test valid response does not raise."""
-    _check_response(MagicMock(isError=lambda: False))
-
-
-def test_check_response_error():
-    """Test error response raises ModbusException."""
-    with pytest.raises(ModbusException, match=ERR_READ_FAILED):
-        _check_response(MagicMock(isError=lambda: True))
-
-
 def test_ranges_defined():
     """Test RANGES constant is properly defined."""
     assert len(RANGES) > 0
     assert all(isinstance(s, int) and isinstance(c, int) for s, c in RANGES)
 
 
+def test_ranges_do_not_overlap():
+    """Test no register is read by more than one range."""
+    for (start, count), (next_start, _) in pairwise(sorted(RANGES)):
+        assert start + count <= next_start, f"range at {start} overlaps {next_start}"
+
+
+def test_merged_ranges_cover_ranges():
+    """Test the precomputed reads cover every range exactly once."""
+    members = [member for _, _, group in MERGED_RANGES for member in group]
+    assert sorted(members) == sorted(RANGES)
+    assert len(MERGED_RANGES) < len(RANGES)
+
+
+@pytest.mark.parametrize(
+    ("ranges", "expected"),
+    [
+        # adjacent ranges are merged
+        ([(1, 34), (35, 10)], [(1, 44, [(1, 34), (35, 10)])]),
+        # overlapping ranges are merged, input order does not matter
+        ([(10, 5), (1, 12)], [(1, 14, [(1, 12), (10, 5)])]),
+        # ranges with a gap are kept apart
+        ([(1, 2), (4, 2)], [(1, 2, [(1, 2)]), (4, 2, [(4, 2)])]),
+        # merged reads stay within the Modbus limit
+        ([(1, 100), (101, 26)], [(1, 100, [(1, 100)]), (101, 26, [(101, 26)])]),
+    ],
+)
+def test_merge_ranges(ranges, expected):
+    """Test ranges are merged into reads of at most 125 registers."""
+    assert merge_ranges(ranges) == expected
+
+
 # ==================== Dump Registers Tests ====================
 
 
-async def test_dump_connection_failure():
-    """Test connection failure raises ConnectionError."""
-    with patch(MODBUS_CLIENT) as mock_class:
-        mock_class.return_value.connect = AsyncMock(return_value=False)
-        with pytest.raises(ConnectionError, match="Failed to connect"):
-            await dump_registers("192.168.1.100", 502)
+async def test_dump_not_connected(mock_client):
+    """Test a disconnected client raises ConnectionError without reading."""
+    mock_client.connected = False
+    with pytest.raises(ConnectionError, match=ERR_NOT_CONNECTED):
+        await dump_registers(mock_client)
+    mock_client.read_raw.assert_not_called()
 
 
-async def test_dump_successful_block_read():
+async def test_dump_successful_block_read(mock_client):
     """Test successful block read returns registers."""
-    with patch(MODBUS_CLIENT) as mock_class:
-        mock = MagicMock()
-        mock.connect = AsyncMock(return_value=True)
-        mock.close = MagicMock()
-        mock.read_holding_registers = AsyncMock(
-            return_value=MagicMock(isError=lambda: False, registers=[1, 2, 3])
-        )
-        mock_class.return_value = mock
-        result = await dump_registers("192.168.1.100", 502)
-        assert len(result) > 0
-        mock.close.assert_called_once()
-
-
-async def test_dump_block_fallback_to_individual():
+    mock_client.read_raw = AsyncMock(side_effect=lambda _start, count: [1] * count)
+    result = await dump_registers(mock_client)
+    assert len(result) > 0
+    mock_client.close.assert_not_called()
+
+
+async def test_dump_block_fallback_to_individual(mock_client):
     """Test block read failure falls back to individual reads."""
-    with patch(MODBUS_CLIENT) as mock_class:
-        mock = MagicMock()
-        mock.connect = AsyncMock(return_value=True)
-        mock.close = MagicMock()
-        call_count = [0]
-
-        def make_response(*args, **kwargs):
-            call_count[0] += 1
-            resp = MagicMock()
-            resp.isError = lambda: call_count[0] % 2 == 1
-            resp.registers = [42]
-            return resp
-
-        mock.read_holding_registers = AsyncMock(side_effect=make_response)
-        mock_class.return_value = mock
-        result = await dump_registers("192.168.1.100", 502)
-        assert len(result) > 0
-
-
-async def test_dump_all_reads_fail():
+
+    async def read(start, count):
+        if count > 2:
+            raise ModbusException(ERR_READ)
+        return [start] * count
+
+    mock_client.read_raw = AsyncMock(side_effect=read)
+    with patch(DIAG_RANGES, merge_ranges([(20, 3)])):
+        result = await dump_registers(mock_client)
+    assert result == {20: [20], 21: [21], 22: [22]}
+
+
+async def test_dump_fallback_reads_32bit_registers_whole(mock_client):
+    """Test the per-register fallback reads both words of 32-bit registers."""
+
+    async def read(start, count):
+        if count > 2:
+            raise ModbusException(ERR_READ)
+        return [start] * count
+
+    mock_client.read_raw = AsyncMock(side_effect=read)
+    with patch(DIAG_RANGES, merge_ranges([(REG_FIRMWARE - 1, 3)])):
+        result = await dump_registers(mock_client)
+    assert result == {
+        REG_FIRMWARE - 1: [REG_FIRMWARE - 1],
+        REG_FIRMWARE: [REG_FIRMWARE, REG_FIRMWARE],
+    }
+    calls = [call.args for call in mock_client.read_raw.call_args_list]
+    assert (REG_FIRMWARE, 2) in calls
+    assert all(start != REG_FIRMWARE + 1 for start, _ in calls)
+
+
+async def test_dump_merged_read_split_into_ranges(mock_client):
+    """Test a merged read is split back into the original ranges."""
+    mock_client.read_raw = AsyncMock(return_value=[7, 8, 9])
+    with patch(DIAG_RANGES, merge_ranges([(1, 2), (3, 1)])):
+        result = await dump_registers(mock_client)
+    assert result == {1: [7, 8], 3: [9]}
+    mock_client.read_raw.assert_called_once_with(1, 3)
+
+
+async def test_dump_merged_read_failure_reads_ranges(mock_client):
+    """Test a failed merged read falls back to reading each range."""
+
+    async def read(start, count):
+        if count > 2:
+            raise ModbusException(ERR_READ)
+        return [start] * count
+
+    mock_client.read_raw = AsyncMock(side_effect=read)
+    with patch(DIAG_RANGES, merge_ranges([(1, 2), (3, 1)])):
+        result = await dump_registers(mock_client)
+    assert result == {1: [1, 1], 3: [3]}
+
+
+async def test_dump_all_reads_fail(mock_client):
     """Test when all reads fail returns empty dict."""
-    with patch(MODBUS_CLIENT) as mock_class:
-        mock = MagicMock()
-        mock.connect = AsyncMock(return_value=True)
-        mock.close = MagicMock()
-        mock.read_holding_registers = AsyncMock(
-            return_value=MagicMock(isError=lambda: True)
-        )
-        mock_class.return_value = mock
-        assert await dump_registers("192.168.1.100", 502) == {}
-
-
-async def test_dump_client_closed_on_exception():
-    """Test client is closed even when exception occurs."""
-    with patch(MODBUS_CLIENT) as mock_class:
-        mock = MagicMock()
-        mock.connect = AsyncMock(return_value=True)
-        mock.close = MagicMock()
-        mock.read_holding_registers = AsyncMock(side_effect=RuntimeError("Unexpected"))
-        mock_class.return_value = mock
-        with pytest.raises(RuntimeError):
-            await dump_registers("192.168.1.100", 502)
-        mock.close.assert_called_once()
+    mock_client.read_raw = AsyncMock(side_effect=ModbusException(ERR_READ))
+    assert await dump_registers(mock_client) == {}
 
 
 # ==================== Diagnostics Entry Tests ====================
@@ -150,6 +193,36 @@ async def test_diagnostics_entry(hass, mock_entry, side_effect, expected_registe
         mock_dump,
     ):
         result = await async_get_config_entry_diagnostics(hass, mock_entry)
+    mock_dump.assert_called_once_with(mock_entry.runtime_data.coordinator.client)
     assert "config_entry" in result
     assert result["registers"] == expected_registers
     assert result["coordinator_data"] == {"test": "data"}
+
+
+async def test_diagnostics_reuses_recent_dump(hass, mock_entry):
+    """Test a dump is reused within DUMP_MAX_AGE and refreshed after it."""
+    mock_dump = AsyncMock(return_value={1: [1]})
+    with (
+        patch("custom_components.komfovent.diagnostics.dump_registers", mock_dump),
+        patch("custom_components.komfovent.diagnostics.time.monotonic") as now,
+    ):
+        now.return_value = 1000.0
+        await async_get_config_entry_diagnostics(hass, mock_entry)
+        now.return_value = 1000.0 + DUMP_MAX_AGE - 1
+        result = await async_get_config_entry_diagnostics(hass, mock_entry)
+        assert result["registers"] == {1: [1]}
+        assert mock_dump.call_count == 1
+
+        now.return_value = 1000.0 + DUMP_MAX_AGE
+        await async_get_config_entry_diagnostics(hass, mock_entry)
+        assert mock_dump.call_count == 2
+
+
+async def test_diagnostics_failed_dump_not_cached(hass, mock_entry):
+    """Test a failed dump is retried on the next download."""
+    mock_dump = AsyncMock(side_effect=[ConnectionError("down"), {1: [1]}])
+    with patch("custom_components.komfovent.diagnostics.dump_registers", mock_dump):
+        first = await async_get_config_entry_diagnostics(hass, mock_entry)
+        second = await async_get_config_entry_diagnostics(hass, mock_entry)
+    assert first["registers"] == {}
+    assert second["registers"] == {1: [1]}
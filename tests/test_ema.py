@@ -2,7 +2,7 @@
 
 import pytest
 
-from custom_components.komfovent.core.ema import apply_ema
+from custom_components.komfovent.core.ema import apply_ema, apply_ema_alpha, ema_alpha
 
 
 class TestApplyEma:
@@ -171,3 +171,19 @@ class TestApplyEma:
         """Test precision parameter controls decimal rounding."""
         result = apply_ema(25.0, 20.0, tau=600, dt=60.0, precision=precision)
         assert result == expected
+
+
+class TestApplyEmaAlpha:
+    """Test cases for filtering with a precalculated alpha."""
+
+    def test_ema_alpha(self) -> None:
+        """Test alpha is dt / (tau + dt)."""
+        assert ema_alpha(600, 60.0) == pytest.approx(60 / 660)
+
+    def test_matches_apply_ema(self) -> None:
+        """Test filtering with a shared alpha matches apply_ema."""
+        alpha = ema_alpha(300, 30.0)
+        for current, previous in ((25.0, 20.0), (-5.5, 3.25), (0.0, 100.0)):
+            assert apply_ema_alpha(current, previous, alpha) == apply_ema(
+                current, previous, 300, 30.0
+            )
@@ -37,6 +37,9 @@ def test_get_controller_version():
     assert get_controller_version(0) == (Controller.C6, 0, 0, 0, 0)
     assert get_controller_version(0xFFFFFFFF) == (Controller.NA, 15, 15, 255, 4095)
 
+    # Unknown controller type nibble falls back to NA
+    assert get_controller_version(0x30000000) == (Controller.NA, 0, 0, 0, 0)
+
 
 def test_get_panel_version():
     """
@@ -60,6 +63,12 @@ def test_get_panel_version():
     assert get_panel_version(0x20000000) == (Panel.NA, 0, 0, 0, 0)
 
 
+def test_versions_are_cached():
+    """Test repeated lookups of the same firmware value reuse the decoded tuple."""
+    assert get_controller_version(20099140) is get_controller_version(20099140)
+    assert get_panel_version(17838105) is get_panel_version(17838105)
+
+
 def test_build_device_info(mock_coordinator):
     """Test build_device_info returns correct device info dictionary."""
     device_info = build_device_info(mock_coordinator)
@@ -192,7 +192,9 @@ class TestAsyncUpdateListener:
         await _async_update_listener(hass, mock_config_entry_with_updated_options)
 
         # Verify the coordinator's update_interval was updated
-        assert mock_coordinator.update_interval == timedelta(seconds=120)
+        mock_coordinator.set_base_update_interval.assert_called_once_with(
+            timedelta(seconds=120)
+        )
 
     async def test_update_listener_uses_default_when_option_missing(
         self, hass: HomeAssistant, mock_coordinator, mock_config_entry
@@ -207,8 +209,8 @@ class TestAsyncUpdateListener:
         await _async_update_listener(hass, mock_config_entry)
 
         # Verify the coordinator's update_interval was set to default
-        assert mock_coordinator.update_interval == timedelta(
-            seconds=DEFAULT_UPDATE_INTERVAL
+        mock_coordinator.set_base_update_interval.assert_called_once_with(
+            timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
         )
 
 
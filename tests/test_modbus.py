@@ -5,13 +5,30 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pymodbus import ModbusException
 
-from custom_components.komfovent.modbus import KomfoventModbusClient
+from custom_components.komfovent.modbus import (
+    KomfoventModbusClient,
+    _block_layout,
+    decode_registers_into,
+)
+from custom_components.komfovent.registers import (
+    REGISTER_TYPES,
+    REGISTERS_16BIT_SIGNED,
+    REGISTERS_16BIT_UNSIGNED,
+    REGISTERS_32BIT_UNSIGNED,
+    RegisterType,
+)
 
 # Patch paths
 MODBUS_CLIENT = "custom_components.komfovent.modbus.AsyncModbusTcpClient"
-REG_32U = "custom_components.komfovent.modbus.REGISTERS_32BIT_UNSIGNED"
-REG_16U = "custom_components.komfovent.modbus.REGISTERS_16BIT_UNSIGNED"
-REG_16S = "custom_components.komfovent.modbus.REGISTERS_16BIT_SIGNED"
+REG_TYPES = "custom_components.komfovent.modbus.REGISTER_TYPES"
+
+
+@pytest.fixture(autouse=True)
+def clear_block_layouts():
+    """Drop cached block layouts so patched register types take effect."""
+    _block_layout.cache_clear()
+    yield
+    _block_layout.cache_clear()
 
 
 @pytest.fixture
@@ -23,6 +40,89 @@ def mock_pymodbus():
         yield mock
 
 
+def decode(start: int, words: list[int]) -> dict[int, int]:
+    """Decode words with decode_registers_into into a new dict."""
+    data: dict[int, int] = {}
+    decode_registers_into(start, words, data)
+    return data
+
+
+def reference_decode(start: int, words: list[int]) -> dict[int, int]:
+    """Decode words register by register, without the cached block layout."""
+    data: dict[int, int] = {}
+    offset = 0
+    while offset < len(words):
+        reg, value = start + offset, words[offset]
+        reg_type = REGISTER_TYPES[reg]
+        if reg_type is RegisterType.UINT32:
+            data[reg] = value * 0x10000 + words[offset + 1]
+            offset += 2
+            continue
+        if reg_type is RegisterType.INT16 and value >= 0x8000:
+            value -= 0x10000
+        data[reg] = value
+        offset += 1
+    return data
+
+
+# ==================== Register Type Tests ====================
+
+
+def test_register_types_match_register_sets():
+    """Test each register maps to exactly the type of the set it is in."""
+    sets = (
+        (REGISTERS_16BIT_UNSIGNED, RegisterType.UINT16),
+        (REGISTERS_16BIT_SIGNED, RegisterType.INT16),
+        (REGISTERS_32BIT_UNSIGNED, RegisterType.UINT32),
+    )
+    assert sum(len(regs) for regs, _ in sets) == len(REGISTER_TYPES)
+    for regs, register_type in sets:
+        assert all(REGISTER_TYPES[reg] is register_type for reg in regs)
+
+
+# ==================== Decode Tests ====================
+
+
+@pytest.mark.parametrize(
+    ("start", "count"),
+    [(1, 34), (100, 59), (200, 18), (600, 11), (900, 62), (1000, 6)],
+)
+def test_decode_registers_matches_reference(start, count):
+    """Test decoding a polled window matches decoding register by register."""
+    words = [(reg * 7919) & 0xFFFF for reg in range(start, start + count)]
+    assert decode(start, words) == reference_decode(start, words)
+
+
+@pytest.mark.parametrize(
+    ("word", "expected"),
+    [(0, 0), (1, 1), (0x7FFF, 32767), (0x8000, -32768), (0xFFF6, -10), (0xFFFF, -1)],
+)
+def test_decode_signed_register(word, expected):
+    """Test signed registers are sign-extended from 16 bits."""
+    with patch(REG_TYPES, {10: RegisterType.INT16}):
+        assert decode(10, [word]) == {10: expected}
+
+
+def test_block_layout_splits_offsets_by_type():
+    """Test the layout groups word offsets per register type."""
+    types = {
+        10: RegisterType.UINT16,
+        11: RegisterType.UINT32,
+        13: RegisterType.INT16,
+        14: RegisterType.UINT16,
+    }
+    with patch(REG_TYPES, types):
+        layout = _block_layout(10, 5)
+    assert layout.uint16 == (0, 4)
+    assert layout.int16 == (3,)
+    assert layout.uint32 == (1,)
+
+
+def test_block_layout_is_cached():
+    """Test the layout of a window is computed once."""
+    assert _block_layout(1, 34) is _block_layout(1, 34)
+
+
 # ==================== Init Tests ====================
 
 
@@ -43,9 +143,7 @@ async def test_read_32bit_missing_second_register(mock_pymodbus):
         return_value=MagicMock(isError=lambda: False, registers=[1234])
     )
     with (
-        patch(REG_32U, {1000}),
-        patch(REG_16U, set()),
-        patch(REG_16S, set()),
+        patch(REG_TYPES, {1000: RegisterType.UINT32}),
         pytest.raises(ValueError, match="value not retrieved"),
     ):
         await KomfoventModbusClient("192.168.1.100", 502).read(1000, 1)
@@ -57,38 +155,69 @@ async def test_read_unknown_register_type(mock_pymodbus):
         return_value=MagicMock(isError=lambda: False, registers=[1234])
     )
     with (
-        patch(REG_32U, set()),
-        patch(REG_16U, set()),
-        patch(REG_16S, set()),
+        patch(REG_TYPES, {}),
         pytest.raises(NotImplementedError, match="not found"),
     ):
         await KomfoventModbusClient("192.168.1.100", 502).read(500, 1)
 
 
+async def test_read_into_updates_existing_dict(mock_pymodbus):
+    """Test read_into stores converted values without replacing others."""
+    mock_pymodbus.read_holding_registers = AsyncMock(
+        return_value=MagicMock(isError=lambda: False, registers=[0xFFFF, 7])
+    )
+    out = {1: 42}
+    with patch(REG_TYPES, {10: RegisterType.INT16, 11: RegisterType.UINT16}):
+        await KomfoventModbusClient("192.168.1.100", 502).read_into(10, 2, out)
+    assert out == {1: 42, 10: -1, 11: 7}
+    mock_pymodbus.read_holding_registers.assert_called_once_with(address=9, count=2)
+
+
+async def test_read_raw_returns_undecoded_words(mock_pymodbus):
+    """Test read_raw returns words of undocumented registers unchanged."""
+    mock_pymodbus.read_holding_registers = AsyncMock(
+        return_value=MagicMock(isError=lambda: False, registers=[0xFFFF, 7])
+    )
+    with patch(REG_TYPES, {}):
+        words = await KomfoventModbusClient("192.168.1.100", 502).read_raw(500, 2)
+    assert words == [0xFFFF, 7]
+    mock_pymodbus.read_holding_registers.assert_called_once_with(address=499, count=2)
+
+
+@pytest.mark.parametrize("connected", [True, False])
+def test_connected(mock_pymodbus, connected):
+    """Test connected reflects the underlying pymodbus client."""
+    mock_pymodbus.connected = connected
+    assert KomfoventModbusClient("192.168.1.100", 502).connected is connected
+
+
+async def test_read_error_response(mock_pymodbus):
+    """Test read raises ModbusException on error response."""
+    mock_pymodbus.read_holding_registers = AsyncMock(
+        return_value=MagicMock(isError=lambda: True)
+    )
+    with pytest.raises(ModbusException, match="Error reading registers"):
+        await KomfoventModbusClient("192.168.1.100", 502).read(10, 2)
+
+
 # ==================== Write Tests ====================
 
 
 @pytest.mark.parametrize(
-    ("register_set", "register", "value", "method", "expected_args"),
+    ("register_type", "register", "value", "method", "expected_args"),
     [
-        (REG_16U, 100, 42, "write_register", (99, 42)),
-        (REG_16S, 100, -10, "write_register", (99, 65526)),
+        (RegisterType.UINT16, 100, 42, "write_register", (99, 42)),
+        (RegisterType.INT16, 100, -10, "write_register", (99, 65526)),
     ],
 )
 async def test_write_16bit(
-    mock_pymodbus, register_set, register, value, method, expected_args
+    mock_pymodbus, register_type, register, value, method, expected_args
 ):
     """Test write to 16-bit registers."""
     mock_pymodbus.write_register = AsyncMock(
         return_value=MagicMock(isError=lambda: False)
     )
-    patches = [(REG_16U, set()), (REG_16S, set()), (REG_32U, set())]
-    patches = [(p, {register} if p == register_set else s) for p, s in patches]
-    with (
-        patch(patches[0][0], patches[0][1]),
-        patch(patches[1][0], patches[1][1]),
-        patch(patches[2][0], patches[2][1]),
-    ):
+    with patch(REG_TYPES, {register: register_type}):
         await KomfoventModbusClient("192.168.1.100", 502).write(register, value)
     getattr(mock_pymodbus, method).assert_called_once_with(*expected_args)
 
@@ -98,7 +227,7 @@ async def test_write_32bit_unsigned(mock_pymodbus):
     mock_pymodbus.write_registers = AsyncMock(
         return_value=MagicMock(isError=lambda: False)
     )
-    with patch(REG_16U, set()), patch(REG_16S, set()), patch(REG_32U, {100}):
+    with patch(REG_TYPES, {100: RegisterType.UINT32}):
         await KomfoventModbusClient("192.168.1.100", 502).write(100, 0x12345678)
     mock_pymodbus.write_registers.assert_called_once_with(
         address=99, values=[0x1234, 0x5678]
@@ -108,9 +237,7 @@ async def test_write_32bit_unsigned(mock_pymodbus):
 async def test_write_unknown_register_type(mock_pymodbus):
     """Test write raises NotImplementedError for unknown register type."""
     with (
-        patch(REG_16U, set()),
-        patch(REG_16S, set()),
-        patch(REG_32U, set()),
+        patch(REG_TYPES, {}),
         pytest.raises(NotImplementedError, match="not found"),
     ):
         await KomfoventModbusClient("192.168.1.100", 502).write(500, 42)
@@ -122,7 +249,7 @@ async def test_write_error_response(mock_pymodbus):
         return_value=MagicMock(isError=lambda: True)
     )
     with (
-        patch(REG_16U, {100}),
+        patch(REG_TYPES, {100: RegisterType.UINT16}),
         pytest.raises(ModbusException, match="Error writing register"),
     ):
         await KomfoventModbusClient("192.168.1.100", 502).write(100, 42)
@@ -533,6 +533,12 @@ def test_alarm_code_messages_known():
     assert ALARM_CODE_MESSAGES[0x81] == "Change Air Filter"
 
 
+def test_alarm_code_messages_read_only():
+    """Test the alarm message table cannot be mutated at runtime."""
+    with pytest.raises(TypeError):
+        ALARM_CODE_MESSAGES[0x7F] = "Injected"  # type: ignore[index]
+
+
 def test_alarm_code_messages_unknown_fallback():
     """Test unknown alarm code is not in the lookup table."""
     assert 0x7F not in ALARM_CODE_MESSAGES